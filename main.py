@@ -4,6 +4,7 @@ from pathlib import Path
 from src.extractor import (
     CsvWriter,
     NubankTransactionsExtractor,
+    PdfHandle,
     SicoobCardStatementExtractor,
     XlsxWriter,
     detect_bank,
@@ -63,12 +64,14 @@ def main():
 
     out_path = Path(args.out) if args.out else pdf_path.with_suffix(f".{args.format}")
 
-    bank = args.bank if args.bank != "auto" else detect_bank(pdf_path)
-    if bank == "sicoob":
-        extractor = SicoobCardStatementExtractor(statement_year=args.year)
-    else:
-        extractor = NubankTransactionsExtractor(statement_year=args.year, holder_name=args.owner)
-    result = extractor.extract(pdf_path)
+    # abre o PDF uma única vez: detecção do banco e extração reaproveitam o mesmo handle
+    with PdfHandle(pdf_path) as pdf:
+        bank = args.bank if args.bank != "auto" else detect_bank(pdf)
+        if bank == "sicoob":
+            extractor = SicoobCardStatementExtractor(statement_year=args.year)
+        else:
+            extractor = NubankTransactionsExtractor(statement_year=args.year, holder_name=args.owner)
+        result = extractor.extract(pdf)
 
     if args.format == "xlsx":
         XlsxWriter().write_report(result, out_path)
@@ -1,25 +1,182 @@
 from __future__ import annotations
 
 import csv
-import re
+import os
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from datetime import date, datetime
+from itertools import repeat
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator
 
 try:
-    import pdfplumber
+    import pypdfium2 as pdfium
 except ModuleNotFoundError as e:  # pragma: no cover
-    raise ModuleNotFoundError(
-        'Dependência ausente: "pdfplumber". Instale com: pip install pdfplumber'
-    ) from e
+    pdfium = None
+    try:
+        from pdfminer.high_level import extract_text as pdfminer_extract_text
+    except ModuleNotFoundError:
+        raise ModuleNotFoundError(
+            'Dependência ausente: "pypdfium2". Instale com: pip install pypdfium2'
+        ) from e
 
+from . import _parser
+from ._parser import TransactionRow
 
-@dataclass(frozen=True)
-class TransactionRow:
-    data: str
-    descricao: str
-    valor: str
+# O pdfium extrai uma página em ~0,5-0,7 ms, enquanto só subir o pool custa ~16 ms
+# com fork (Linux) e bem mais com spawn (Windows, que reimporta tudo em cada worker).
+# Uma fatura típica (10-20 páginas) sai em ~7 ms no caminho serial, então o pool
+# só entra em documentos muito acima disso.
+_PARALLEL_MIN_PAGES = 200
+
+
+def _page_text(pdf, index: int) -> str:
+    page = pdf[index]
+    textpage = page.get_textpage()
+    text = textpage.get_text_range()
+    textpage.close()
+    page.close()
+    return text
+
+
+# quantas páginas a thread produtora pode extrair à frente do parser
+_PREFETCH_DEPTH = 2
+_PREFETCH_END = object()
+
+
+def _prefetched(items: Iterator[str], depth: int = _PREFETCH_DEPTH) -> Iterator[str]:
+    """
+    Consome `items` numa thread produtora, no máximo `depth` itens à frente de quem
+    está lendo. A extração do pdfium (ctypes) solta o GIL, então extrair a próxima
+    página e parsear a atual acontecem de fato ao mesmo tempo.
+    """
+    q: queue.Queue = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def produce() -> None:
+        try:
+            # `stop` é conferido antes de puxar o próximo item: cada next() é uma
+            # extração de página
+            while not stop.is_set():
+                item = next(items, _PREFETCH_END)
+                q.put(item)
+                if item is _PREFETCH_END:
+                    return
+        except BaseException as e:
+            q.put(e)
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = q.get()
+            if item is _PREFETCH_END:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        # se o consumidor parar antes do fim, libera a produtora (que pode estar
+        # bloqueada no put) e só sai depois que ela largar o documento
+        stop.set()
+        while producer.is_alive():
+            try:
+                q.get(timeout=0.05)
+            except queue.Empty:
+                pass
+
+
+def _extract_pages_text(pdf_path: str, start: int, stop: int) -> list[str]:
+    """
+    Worker do pool: abre o próprio handle do PDF (pdfium não pode ser compartilhado
+    entre processos) e extrai o texto das páginas [start, stop).
+    """
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        return [_page_text(pdf, i) for i in range(start, stop)]
+    finally:
+        pdf.close()
+
+
+class PdfHandle:
+    """
+    PDF aberto uma única vez e compartilhado entre detect_bank e os extratores.
+
+    Usa pypdfium2, bem mais rápido (e com menos memória) que pdfplumber para texto
+    puro; aqui não precisamos de layout/tabelas. Se pypdfium2 não estiver instalado,
+    o fallback é o pdfminer direto (sem a camada de layout do pdfplumber): o arquivo
+    inteiro é extraído numa passada e separado nas quebras de página ("\f"). O
+    agrupamento de layout do pdfminer pode ordenar/quebrar linhas diferente do
+    pdfium em faturas com várias colunas, então o resultado pode variar.
+
+    O texto da primeira página fica em cache (detecção do banco e cabeçalho do
+    Sicoob). Em PDFs com muitas páginas, a extração das demais (CPU-bound) é dividida
+    em blocos contíguos de páginas entre processos; as páginas continuam saindo em
+    ordem, então o parser (que carrega estado entre páginas) segue sequencial.
+    """
+
+    def __init__(self, pdf_path: Path):
+        self.path = Path(pdf_path)
+        self._first_page_text: str | None = None
+        if pdfium is None:  # pragma: no cover
+            self._pdf = None
+            # o pdfminer termina cada página com "\f"
+            self._pages_text = pdfminer_extract_text(str(self.path)).split("\f")[:-1]
+            self.n_pages = len(self._pages_text)
+        else:
+            self._pdf = pdfium.PdfDocument(str(self.path))
+            self.n_pages = len(self._pdf)
+
+    def __enter__(self) -> PdfHandle:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._pdf is not None:
+            self._pdf.close()
+
+    @property
+    def first_page_text(self) -> str:
+        if self._first_page_text is None:
+            self._first_page_text = self._page_text(0) if self.n_pages else ""
+        return self._first_page_text
+
+    def iter_pages_text(self) -> Iterator[str]:
+        """
+        Texto de cada página, em ordem. A primeira vem do cache.
+        """
+        if not self.n_pages:
+            return
+        yield self.first_page_text
+        if self.n_pages == 1:
+            return
+
+        workers = min(os.cpu_count() or 1, self.n_pages - 1)
+        if pdfium is None:  # pragma: no cover
+            for i in range(1, self.n_pages):
+                yield self._page_text(i)
+            return
+        if self.n_pages < _PARALLEL_MIN_PAGES or workers < 2:
+            # a primeira página já está em cache, então daqui em diante só a thread
+            # produtora mexe no documento
+            yield from _prefetched(self._page_text(i) for i in range(1, self.n_pages))
+            return
+
+        bounds = [1 + (self.n_pages - 1) * k // workers for k in range(workers + 1)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunks = pool.map(
+                _extract_pages_text, repeat(str(self.path)), bounds[:-1], bounds[1:]
+            )
+            for texts in chunks:
+                yield from texts
+
+    def _page_text(self, index: int) -> str:
+        if pdfium is None:  # pragma: no cover
+            return self._pages_text[index]
+        return _page_text(self._pdf, index)
 
 
 @dataclass(frozen=True)
@@ -34,179 +191,28 @@ class NubankTransactionsExtractor:
     Retorna linhas normalizadas com: Data (YYYY-MM-DD), Descrição, Valor (string "R$ ...").
     """
 
-    MONTHS = {
-        "JAN": 1,
-        "FEV": 2,
-        "MAR": 3,
-        "ABR": 4,
-        "MAI": 5,
-        "JUN": 6,
-        "JUL": 7,
-        "AGO": 8,
-        "SET": 9,
-        "OUT": 10,
-        "NOV": 11,
-        "DEZ": 12,
-    }
-
-    DATE_RE = re.compile(r"^(?P<dd>\d{2})\s+(?P<mon>[A-Z]{3})\b")
-    # captura "R$ 1.234,56" e também "−R$ 3,94" / "-R$ 3,94"
-    VALUE_RE = re.compile(
-        r"(?P<sign>[−-]?)\s*R\$\s*(?P<num>\d{1,3}(?:\.\d{3})*,\d{2}|\d+,\d{2})"
-    )
+    # o laço linha a linha vive em src/_parser.py (compilável com mypyc)
+    MONTHS = _parser.MONTHS
+    DATE_RE = _parser.DATE_RE
+    VALUE_RE = _parser.VALUE_RE
+    VALUE_TAIL_RE = _parser.VALUE_TAIL_RE
 
     def __init__(self, statement_year: int = 2026, holder_name: str = "Nome do Titular"):
         self.statement_year = statement_year
         self.holder_name = holder_name
 
-    def extract(self, pdf_path: Path) -> NubankExtractionResult:
-        in_transactions = False
-        in_holder_block = False
-        in_payments = False
-
-        current: TransactionRow | None = None
-        transacoes: list[TransactionRow] = []
-        pagamentos: list[TransactionRow] = []
-
-        def flush():
-            nonlocal current
-            if current:
-                if in_payments:
-                    pagamentos.append(current)
-                else:
-                    transacoes.append(current)
-                current = None
-
-        with pdfplumber.open(str(pdf_path)) as pdf:
-            for page in pdf.pages:
-                text = page.extract_text() or ""
-                for raw_line in text.splitlines():
-                    line = raw_line.strip()
-                    if not line:
-                        continue
-
-                    # O cabeçalho "TRANSAÇÕES DE ..." se repete a cada página. Se a gente
-                    # zerar o bloco do titular aqui, só extrai a primeira página.
-                    if line.startswith("TRANSAÇÕES DE "):
-                        in_transactions = True
-                        flush()
-                        continue
-
-                    if not in_transactions:
-                        continue
-
-                    # Enquanto não entramos em "Pagamentos e Financiamentos", só começamos a
-                    # capturar transações após a linha do titular. Depois que entramos em
-                    # "Pagamentos e Financiamentos", capturamos independentemente do titular.
-                    if not in_payments and line.startswith(self.holder_name):
-                        in_holder_block = True
-                        flush()
-                        continue
-                    if in_payments and line.startswith(self.holder_name):
-                        # cabeçalho no topo da página: ignorar para não contaminar descrições
-                        continue
-
-                    # entrada do bloco "Pagamentos e Financiamentos"
-                    if line.startswith("Pagamentos e Financiamentos"):
-                        flush()
-                        in_payments = True
-                        in_holder_block = False
-                        continue
-                    if not in_payments and not in_holder_block:
-                        continue
-
-                    # ruídos comuns
-                    if re.match(r"^\d+\s*de\s*\d+$", line):
-                        continue
-                    if "FATURA" in line and "EMISSÃO" in line:
-                        continue
-
-                    mdate = self.DATE_RE.match(line)
-                    if mdate:
-                        flush()
-                        dd = int(mdate.group("dd"))
-                        mon_abbr = mdate.group("mon")
-                        if mon_abbr not in self.MONTHS:
-                            continue
-
-                        yyyy = self._parse_year(mon_abbr)
-                        mm = self.MONTHS[mon_abbr]
-                        d = date(yyyy, mm, dd).isoformat()
-
-                        desc = self._clean_desc(line[mdate.end() :])
-                        desc = self._strip_trailing_brl(desc)
-
-                        vals = list(self.VALUE_RE.finditer(line))
-                        valor = (
-                            self._brl_to_str(vals[-1].group("sign"), vals[-1].group("num"))
-                            if vals
-                            else ""
-                        )
-
-                        current = TransactionRow(data=d, descricao=desc, valor=valor)
-                        continue
-
-                    # continuação da descrição e/ou valor
-                    if current:
-                        vals = list(self.VALUE_RE.finditer(line))
-                        if vals:
-                            current = TransactionRow(
-                                data=current.data,
-                                descricao=current.descricao,
-                                valor=self._brl_to_str(
-                                    vals[-1].group("sign"), vals[-1].group("num")
-                                ),
-                            )
-                        else:
-                            extra = self._clean_desc(line)
-                            if extra:
-                                current = TransactionRow(
-                                    data=current.data,
-                                    descricao=(current.descricao + " " + extra).strip(),
-                                    valor=current.valor,
-                                )
-
-                # O PDF repete no topo da página o nome completo do titular e outros
-                # dados. Sem este flush, essa linha pode ser concatenada na última
-                # transação da página anterior.
-                flush()
-
-        flush()
+    def extract(self, pdf: PdfHandle) -> NubankExtractionResult:
+        state = _parser.NubankParserState()
+        for text in pdf.iter_pages_text():
+            _parser.parse_nubank_page(
+                _parser.split_lines(text), state, self.holder_name, self.statement_year
+            )
+
         return NubankExtractionResult(
-            transacoes=transacoes,
-            pagamentos_e_financiamentos=pagamentos,
+            transacoes=[r.to_row() for r in state.transacoes],
+            pagamentos_e_financiamentos=[r.to_row() for r in state.pagamentos],
         )
 
-    def _parse_year(self, mon_abbr: str) -> int:
-        # fatura típica: "31 DEZ a 31 JAN" com vencimento/ano 2026 -> DEZ é 2025
-        return self.statement_year - 1 if mon_abbr == "DEZ" else self.statement_year
-
-    @staticmethod
-    def _brl_to_str(sign: str, num: str) -> str:
-        sign = "-" if sign in ("-", "−") else ""
-        return f"{sign}R$ {num}"
-
-    @staticmethod
-    def _clean_desc(s: str) -> str:
-        s = s.strip()
-        # remove máscara do cartão "•••• 0539" etc
-        s = re.sub(r"^•{4}\s+\d{4}\s+", "", s)
-        return re.sub(r"\s+", " ", s).strip()
-
-    @classmethod
-    def _strip_trailing_brl(cls, desc: str) -> str:
-        """
-        Remove um sufixo do tipo "R$ 123,45" (com sinal opcional) do fim da string.
-        Isso evita duplicar o valor na coluna Descrição.
-        """
-        matches = list(cls.VALUE_RE.finditer(desc))
-        if not matches:
-            return desc
-
-        last = matches[-1]
-        if last.end() == len(desc):
-            return desc[: last.start()].rstrip()
-        return desc
 
 class SicoobCardStatementExtractor:
     """
@@ -216,202 +222,42 @@ class SicoobCardStatementExtractor:
     - pagamentos_e_financiamentos: bloco "MOVIMENTOS" (saldo anterior, pagamentos, encargos etc.)
     """
 
-    DATE_DDMM_RE = re.compile(r"^(?P<dd>\d{2})/(?P<mm>\d{2})\b")
-    DATE_DDMMYYYY_RE = re.compile(r"\b(?P<dd>\d{2})/(?P<mm>\d{2})/(?P<yyyy>\d{4})\b")
-    # último número do tipo 1.234,56 ou -30,00 (sem "R$")
-    LAST_VALUE_RE = re.compile(r"(?P<num>-?\d{1,3}(?:\.\d{3})*,\d{2})\s*$")
+    # o laço linha a linha vive em src/_parser.py (compilável com mypyc)
+    DATE_DDMM_RE = _parser.DATE_DDMM_RE
+    DATE_DDMMYYYY_RE = _parser.DATE_DDMMYYYY_RE
+    LAST_VALUE_RE = _parser.LAST_VALUE_RE
 
     def __init__(self, statement_year: int = 2026):
         self.statement_year = statement_year
 
-    def extract(self, pdf_path: Path) -> NubankExtractionResult:
-        in_movimentos = False
-        in_gastos = False
-
-        current: TransactionRow | None = None
-        transacoes: list[TransactionRow] = []
-        movimentos: list[TransactionRow] = []
-
-        statement_month = 1
-        statement_year = self.statement_year
-        valid_months_gastos: set[int] = {1, 12}
-
-        def flush():
-            nonlocal current
-            if current:
-                if in_movimentos and not in_gastos:
-                    movimentos.append(current)
-                elif in_gastos:
-                    transacoes.append(current)
-                current = None
-
-        with pdfplumber.open(str(pdf_path)) as pdf:
-            # tenta inferir mês/ano da fatura a partir do cabeçalho (ex.: 31/01/2026 ...)
-            for page in pdf.pages[:1]:
-                header_text = page.extract_text() or ""
-                m = self.DATE_DDMMYYYY_RE.search(header_text)
-                if m:
-                    statement_year = int(m.group("yyyy"))
-                    statement_month = int(m.group("mm"))
-                    prev_month = 12 if statement_month == 1 else (statement_month - 1)
-                    valid_months_gastos = {statement_month, prev_month}
-                    break
-
-            for page in pdf.pages:
-                text = page.extract_text() or ""
-                for raw_line in text.splitlines():
-                    line = raw_line.strip()
-                    if not line:
-                        continue
-
-                    if line.startswith("MOVIMENTOS"):
-                        flush()
-                        in_movimentos = True
-                        in_gastos = False
-                        continue
-
-                    if line.startswith("GASTOS DE "):
-                        flush()
-                        in_gastos = True
-                        in_movimentos = False
-                        continue
-
-                    # fim do bloco de gastos
-                    if in_gastos and (line.startswith("TOTAL ") or line.startswith("DEMONSTRATIVO")):
-                        flush()
-                        in_gastos = False
-                        continue
-
-                    if not in_movimentos and not in_gastos:
-                        continue
-
-                    # ignora cabeçalhos/ruído
-                    if line == "SICOOB" or "EXTRATO DE CARTÃO DE CRÉDITO" in line:
-                        continue
-                    if line.startswith("Cliente:") or line.startswith("Fatura de "):
-                        continue
-
-                    # linha "SALDO ANTERIOR ..." (sem data)
-                    if in_movimentos and line.startswith("- SALDO ANTERIOR"):
-                        flush()
-                        val = self._parse_last_value_as_brl(line)
-                        desc = line.lstrip("-").strip()
-                        desc = self._strip_trailing_value(desc)
-                        current = TransactionRow(
-                            data="",
-                            descricao=f"SALDO ANTERIOR: {desc.replace('SALDO ANTERIOR', '').strip()}",
-                            valor=val or "",
-                        )
-                        flush()
-                        continue
-
-                    # tratar quebra de linha que começa com "01/02" (parcela) etc
-                    # No Sicoob, compras parceladas aparecem como "01/02", "02/03" (parcela),
-                    # e quando a descrição quebra, isso pode vir no começo da linha, parecendo
-                    # uma data DD/MM. Para evitar criar uma transação falsa, usamos o mês de
-                    # referência da fatura:
-                    # - em "GASTOS", as datas reais tendem a ficar entre {mês da fatura, mês anterior}
-                    # - se vier DD/MM com MM fora desse conjunto e existir um lançamento aberto,
-                    #   tratamos como continuação.
-                    if current and in_gastos:
-                        mstart = self.DATE_DDMM_RE.match(line)
-                        if mstart:
-                            mm0 = int(mstart.group("mm"))
-                            if mm0 not in valid_months_gastos:
-                                current = self._merge_continuation(current, line)
-                                continue
-
-                    mdate = self.DATE_DDMM_RE.match(line)
-                    if mdate:
-                        flush()
-                        dd = int(mdate.group("dd"))
-                        mm = int(mdate.group("mm"))
-                        yyyy = statement_year - 1 if mm > statement_month else statement_year
-                        d = date(yyyy, mm, dd).isoformat()
-
-                        rest = line[mdate.end() :].strip()
-                        valor = (
-                            self._parse_last_value_as_brl(rest)
-                            or self._parse_last_value_as_brl(line)
-                            or ""
-                        )
-                        desc = self._strip_trailing_value(rest)
-                        current = TransactionRow(data=d, descricao=desc, valor=valor)
-                        continue
-
-                    # continuação (quebras de linha comuns no PDF)
-                    if current:
-                        current = self._merge_continuation(current, line)
-
-                # evita concatenar cabeçalho da página seguinte
-                flush()
-
-        flush()
-        return NubankExtractionResult(
-            transacoes=transacoes,
-            pagamentos_e_financiamentos=movimentos,
-        )
+    def extract(self, pdf: PdfHandle) -> NubankExtractionResult:
+        state = _parser.SicoobParserState(statement_year=self.statement_year)
 
-    def _parse_last_value_as_brl(self, s: str) -> str | None:
-        m = self.LAST_VALUE_RE.search(s.strip())
-        if not m:
-            return None
-        num = m.group("num")
-        sign = "-" if num.startswith("-") else ""
-        num_clean = num[1:] if sign else num
-        return f"{sign}R$ {num_clean}"
-
-    def _strip_trailing_value(self, s: str) -> str:
-        m = self.LAST_VALUE_RE.search(s.strip())
-        if not m:
-            return s.strip()
-        return s[: m.start()].rstrip()
-
-    # helper único para merge de continuação
-    def _merge_continuation(self, current: TransactionRow, line: str) -> TransactionRow:
-        """
-        Junta uma linha de continuação no lançamento atual.
+        # tenta inferir mês/ano da fatura a partir do cabeçalho (ex.: 31/01/2026 ...)
+        m = self.DATE_DDMMYYYY_RE.search(pdf.first_page_text)
+        if m:
+            state.statement_year = int(m.group(3))
+            state.statement_month = int(m.group(2))
+            prev_month = 12 if state.statement_month == 1 else (state.statement_month - 1)
+            state.valid_months_gastos = {state.statement_month, prev_month}
 
-        Regras:
-        - Se a linha termina com um valor (ex.: "CANED 69,15"), anexa a parte textual
-          na descrição e preenche o valor (somente se ainda estiver vazio).
-        - Caso contrário, concatena a linha inteira na descrição.
-        """
-        # evita concatenar linhas de cabeçalho entre páginas
-        if line.startswith("Cliente:") or line.startswith("Conta Cartão:"):
-            return current
-
-        mval = self.LAST_VALUE_RE.search(line.strip())
-        if mval:
-            before = line[: mval.start()].strip()
-            updated = current
-            if before:
-                updated = TransactionRow(
-                    data=updated.data,
-                    descricao=(updated.descricao + " " + before).strip(),
-                    valor=updated.valor,
-                )
-            if not updated.valor:
-                updated = TransactionRow(
-                    data=updated.data,
-                    descricao=updated.descricao,
-                    valor=self._parse_last_value_as_brl(line) or "",
-                )
-            return updated
-
-        return TransactionRow(
-            data=current.data,
-            descricao=(current.descricao + " " + line).strip(),
-            valor=current.valor,
+        for text in pdf.iter_pages_text():
+            _parser.parse_sicoob_page(_parser.split_lines(text), state)
+
+        return NubankExtractionResult(
+            transacoes=[r.to_row() for r in state.transacoes],
+            pagamentos_e_financiamentos=[r.to_row() for r in state.movimentos],
         )
 
 
-def detect_bank(pdf_path: Path) -> str:
+def detect_bank(pdf: PdfHandle) -> str:
     """
     Identifica o banco do PDF: 'nubank' ou 'sicoob'.
+
+    Usa o texto da primeira página, que fica em cache no `PdfHandle` e é reaproveitado
+    pela extração: detectar não custa uma extração a mais.
     """
-    with pdfplumber.open(str(pdf_path)) as pdf:
-        first = (pdf.pages[0].extract_text() or "").upper()
+    first = pdf.first_page_text.upper()
     if "SICOOB" in first and "EXTRATO DE CARTÃO DE CRÉDITO" in first:
         return "sicoob"
     if "NU PAGAMENTOS" in first or "RESUMO DA FATURA ATUAL" in first:
@@ -419,28 +265,36 @@ def detect_bank(pdf_path: Path) -> str:
     # fallback
     return "nubank"
 
+# "R$ 1.234,56" -> " 1234.56" numa única passada: remove "R$" e o separador de
+# milhar "." e troca o decimal "," -> "." (float() ignora os espaços das pontas)
+_BRL_TRANS = str.maketrans({"R": None, "$": None, ".": None, ",": "."})
+
+
 class CsvWriter:
     def write_report(self, result: NubankExtractionResult, out_csv_path: Path) -> None:
         out_csv_path.parent.mkdir(parents=True, exist_ok=True)
-        with out_csv_path.open("w", newline="", encoding="utf-8") as f:
-            w = csv.writer(f)
-            w.writerow(["Data", "Descrição", "Valor"])
+        with out_csv_path.open("w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+            csv.writer(f).writerows(self._rows(result))
+
+    @staticmethod
+    def _rows(result: NubankExtractionResult) -> Iterator[list[str]]:
+        yield ["Data", "Descrição", "Valor"]
 
-            for r in result.transacoes:
-                w.writerow([r.data, r.descricao, r.valor])
+        for r in result.transacoes:
+            yield [r.data, r.descricao, r.valor]
 
-            for r in result.pagamentos_e_financiamentos:
-                # mantém o mesmo formato de 3 colunas, mas marca a origem
-                w.writerow([r.data, f"[Pagamentos e Financiamentos] {r.descricao}", r.valor])
+        for r in result.pagamentos_e_financiamentos:
+            # mantém o mesmo formato de 3 colunas, mas marca a origem
+            yield [r.data, f"[Pagamentos e Financiamentos] {r.descricao}", r.valor]
 
 
 class XlsxWriter:
     def write_report(self, result: NubankExtractionResult, out_xlsx_path: Path) -> None:
         try:
-            from openpyxl import Workbook
+            import xlsxwriter
         except ModuleNotFoundError as e:  # pragma: no cover
             raise ModuleNotFoundError(
-                'Dependência ausente: "openpyxl". Instale com: pip install openpyxl'
+                'Dependência ausente: "xlsxwriter". Instale com: pip install xlsxwriter'
             ) from e
 
         out_xlsx_path.parent.mkdir(parents=True, exist_ok=True)
@@ -453,30 +307,40 @@ class XlsxWriter:
             '_("R$"* #,##0.00_);[Red]_("R$"* (#,##0.00);_("R$"* "-"??_);_(@_)'
         )
 
-        wb = Workbook()
-        ws_trans = wb.active
-        ws_trans.title = "Transações"
+        # constant_memory: cada linha vai direto para o arquivo temporário da planilha,
+        # em vez de manter o workbook inteiro em memória
+        wb = xlsxwriter.Workbook(str(out_xlsx_path), {"constant_memory": True})
+        try:
+            brl_fmt = wb.add_format({"num_format": brl_accounting_format})
 
-        ws_trans.append(["Data", "Descrição", "Valor"])
-        for r in result.transacoes:
-            self._append_row_with_accounting(ws_trans, r, brl_accounting_format)
+            ws_trans = wb.add_worksheet("Transações")
+            self._write_rows_with_accounting(ws_trans, result.transacoes, brl_fmt)
 
-        ws_pay = wb.create_sheet("Pagamentos e Financiamentos")
-        ws_pay.append(["Data", "Descrição", "Valor"])
-        for r in result.pagamentos_e_financiamentos:
-            self._append_row_with_accounting(ws_pay, r, brl_accounting_format)
-
-        wb.save(str(out_xlsx_path))
+            ws_pay = wb.add_worksheet("Pagamentos e Financiamentos")
+            self._write_rows_with_accounting(ws_pay, result.pagamentos_e_financiamentos, brl_fmt)
+        finally:
+            wb.close()
 
     @staticmethod
-    def _append_row_with_accounting(ws, r: TransactionRow, brl_accounting_format: str) -> None:
+    def _write_rows_with_accounting(ws, rows: Iterable[TransactionRow], brl_fmt) -> None:
         """
-        Escreve (Data, Descrição, Valor) onde Valor vira número e recebe formato Contabilidade.
+        Escreve o cabeçalho e as linhas (Data, Descrição, Valor), onde Valor vira número
+        e recebe formato Contabilidade.
         """
-        ws.append([r.data, r.descricao, None])
-        cell = ws.cell(row=ws.max_row, column=3)
-        cell.value = XlsxWriter._parse_brl_to_number(r.valor)
-        cell.number_format = brl_accounting_format
+        ws.write_row(0, 0, ["Data", "Descrição", "Valor"])
+        for row_idx, r in enumerate(rows, start=1):
+            # write_string, não write(): o write() genérico vira hyperlink em descrição
+            # com cara de URL (e fórmula se começar com "="); o openpyxl gravava texto.
+            # String vazia fica sem célula, como antes.
+            if r.data:
+                ws.write_string(row_idx, 0, r.data)
+            if r.descricao:
+                ws.write_string(row_idx, 1, r.descricao)
+            num = XlsxWriter._parse_brl_to_number(r.valor)
+            if num is None:
+                ws.write_blank(row_idx, 2, None, brl_fmt)
+            else:
+                ws.write_number(row_idx, 2, num, brl_fmt)
 
     @staticmethod
     def _parse_brl_to_number(valor: str):
@@ -488,12 +352,8 @@ class XlsxWriter:
             return None
 
         s = valor.strip()
-        sign = -1 if s.startswith("-") or s.startswith("−") else 1
-        s = s.lstrip("−-").strip()
-        s = s.replace("R$", "").strip()
-
-        # remove separador de milhar "." e troca decimal "," -> "."
-        s = s.replace(".", "").replace(",", ".")
+        sign = -1 if s[:1] in ("-", "−") else 1
+        s = s.lstrip("−-").translate(_BRL_TRANS)
         try:
             return sign * float(s)
         except ValueError: